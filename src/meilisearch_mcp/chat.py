@@ -1,4 +1,8 @@
-from typing import Any, Dict, Iterator, List, Optional
+import asyncio
+import contextlib
+import io
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from meilisearch import Client
 from meilisearch.errors import MeilisearchApiError
@@ -7,61 +11,134 @@ from .logging import MCPLogger
 
 logger = MCPLogger()
 
+_SENTINEL = object()
+
 
 class ChatManager:
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, cache_ttl: float = 30.0):
         self.client = client
+        # Workspace reads are cached for cache_ttl seconds, keyed by workspace
+        # uid and by (offset, limit); updates invalidate the affected entries.
+        # Updates also bump a generation counter, and a read only stores its
+        # result if no update finished while it was in flight.
+        self.cache_ttl = cache_ttl
+        self._settings_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._settings_generations: Dict[str, int] = {}
+        self._workspaces_cache: Dict[
+            Tuple[Optional[int], Optional[int]], Tuple[float, Dict[str, Any]]
+        ] = {}
+        self._workspaces_generation = 0
 
-    async def create_chat_completion(
+    def _cached(self, cache: Dict[Any, Tuple[float, Any]], key: Any) -> Optional[Any]:
+        """Return a cached value if it is younger than cache_ttl"""
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[1]
+        return None
+
+    async def stream_chat_completion(
         self,
         workspace_uid: str,
         messages: List[Dict[str, str]],
         model: str = "gpt-3.5-turbo",
         stream: bool = True,
-    ) -> str:
+    ) -> AsyncIterator[str]:
+        """Yield the content of each completion chunk as soon as it arrives."""
         try:
-            logger.info(f"Creating chat completion for workspace: {workspace_uid}")
-
-            # The SDK returns an iterator for streaming responses
-            response_chunks = []
-            for chunk in self.client.create_chat_completion(
-                workspace_uid=workspace_uid,
-                messages=messages,
-                model=model,
-                stream=stream,
-            ):
-                response_chunks.append(chunk)
-
-            # Combine all chunks into a complete response
-            full_response = self._combine_chunks(response_chunks)
+            logger.info(f"Streaming chat completion for workspace: {workspace_uid}")
+
+            # The SDK returns a blocking iterator for streaming responses, so
+            # each chunk is pulled in a worker thread to keep the loop free
+            chunks = iter(
+                self.client.create_chat_completion(
+                    workspace_uid=workspace_uid,
+                    messages=messages,
+                    model=model,
+                    stream=stream,
+                )
+            )
+            loop = asyncio.get_running_loop()
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(None, next, chunks, _SENTINEL)
+                    if chunk is _SENTINEL:
+                        break
+                    content = self._chunk_content(chunk)
+                    if content:
+                        yield content
+            finally:
+                # The SDK generator only closes its streaming response when it
+                # is closed, so do that here when the consumer stops early
+                close = getattr(chunks, "close", None)
+                if close is not None:
+                    await loop.run_in_executor(None, close)
+
             logger.info(
-                f"Chat completion created successfully for workspace: {workspace_uid}"
+                f"Chat completion streamed successfully for workspace: {workspace_uid}"
             )
-            return full_response
 
         except MeilisearchApiError as e:
-            logger.error(f"Meilisearch API error in create_chat_completion: {e}")
+            logger.error(f"Meilisearch API error in stream_chat_completion: {e}")
             raise
         except Exception as e:
-            logger.error(f"Error in create_chat_completion: {e}")
+            logger.error(f"Error in stream_chat_completion: {e}")
             raise
 
-    def _combine_chunks(self, chunks: List[Dict[str, Any]]) -> str:
-        """Combine streaming chunks into a single response message."""
-        content_parts = []
-        for chunk in chunks:
-            if "choices" in chunk and chunk["choices"]:
-                choice = chunk["choices"][0]
-                if "delta" in choice and "content" in choice["delta"]:
-                    content_parts.append(choice["delta"]["content"])
-        return "".join(content_parts)
+    async def create_chat_completion(
+        self,
+        workspace_uid: str,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-3.5-turbo",
+        stream: bool = True,
+        on_chunk: Optional[Callable[[int], Awaitable[None]]] = None,
+    ) -> str:
+        """Create a chat completion and return the combined response.
+
+        If on_chunk is given, it is awaited with the number of chunks received
+        so far each time a chunk of content arrives.
+        """
+        buf = io.StringIO()
+        chunk_count = 0
+        async with contextlib.aclosing(
+            self.stream_chat_completion(
+                workspace_uid, messages, model=model, stream=stream
+            )
+        ) as contents:
+            async for content in contents:
+                buf.write(content)
+                chunk_count += 1
+                if on_chunk is not None:
+                    await on_chunk(chunk_count)
+        return buf.getvalue()
+
+    @staticmethod
+    def _chunk_content(chunk: Dict[str, Any]) -> Optional[str]:
+        """Extract the delta content from a single streaming chunk."""
+        # Nearly every chunk has this shape, so try it directly and only
+        # fall back when a chunk carries no content (e.g. the final one)
+        try:
+            return chunk["choices"][0]["delta"]["content"]
+        except (KeyError, IndexError, TypeError):
+            return None
 
     async def get_chat_workspaces(
         self, offset: Optional[int] = None, limit: Optional[int] = None
     ) -> Dict[str, Any]:
         try:
+            workspaces = self._cached(self._workspaces_cache, (offset, limit))
+            if workspaces is not None:
+                return workspaces
+
             logger.info(f"Getting chat workspaces (offset={offset}, limit={limit})")
-            workspaces = self.client.get_chat_workspaces(offset=offset, limit=limit)
+            generation = self._workspaces_generation
+            workspaces = await asyncio.to_thread(
+                self.client.get_chat_workspaces, offset=offset, limit=limit
+            )
+            if generation == self._workspaces_generation:
+                self._workspaces_cache[(offset, limit)] = (
+                    time.monotonic(),
+                    workspaces,
+                )
             logger.info(
                 f"Retrieved {len(workspaces.get('results', []))} chat workspaces"
             )
@@ -75,8 +152,17 @@ class ChatManager:
 
     async def get_chat_workspace_settings(self, workspace_uid: str) -> Dict[str, Any]:
         try:
+            settings = self._cached(self._settings_cache, workspace_uid)
+            if settings is not None:
+                return settings
+
             logger.info(f"Getting settings for chat workspace: {workspace_uid}")
-            settings = self.client.get_chat_workspace_settings(workspace_uid)
+            generation = self._settings_generations.get(workspace_uid, 0)
+            settings = await asyncio.to_thread(
+                self.client.get_chat_workspace_settings, workspace_uid
+            )
+            if generation == self._settings_generations.get(workspace_uid, 0):
+                self._settings_cache[workspace_uid] = (time.monotonic(), settings)
             logger.info(f"Retrieved settings for workspace: {workspace_uid}")
             return settings
         except MeilisearchApiError as e:
@@ -91,9 +177,16 @@ class ChatManager:
     ) -> Dict[str, Any]:
         try:
             logger.info(f"Updating settings for chat workspace: {workspace_uid}")
-            updated_settings = self.client.update_chat_workspace_settings(
-                workspace_uid, settings
+            updated_settings = await asyncio.to_thread(
+                self.client.update_chat_workspace_settings, workspace_uid, settings
+            )
+            # Updating settings can also create the workspace
+            self._settings_generations[workspace_uid] = (
+                self._settings_generations.get(workspace_uid, 0) + 1
             )
+            self._settings_cache.pop(workspace_uid, None)
+            self._workspaces_generation += 1
+            self._workspaces_cache.clear()
             logger.info(f"Updated settings for workspace: {workspace_uid}")
             return updated_settings
         except MeilisearchApiError as e:
@@ -1,5 +1,8 @@
+import copy
 import httpx
+import requests
 from meilisearch import Client
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, List
 
 from .indexes import IndexManager
@@ -14,17 +17,95 @@ from .__version__ import __version__
 logger = MCPLogger()
 
 
+def create_session() -> requests.Session:
+    """Return an HTTP session whose connection pool fits concurrent tool calls"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _pool(http: Any, session: requests.Session) -> None:
+    """Send every request of an SDK HttpRequests through session, each on
+    its own copy of the HttpRequests.
+
+    The SDK writes Content-Type into the shared headers dict on every call,
+    so concurrent calls from the event loop and worker threads could
+    otherwise send one call's header with another call's body.
+    """
+
+    def own_copy():
+        own = copy.copy(http)
+        own.headers = dict(http.headers)
+        return own
+
+    def pooled_send_request(http_method, path, *args, **kwargs):
+        # The SDK passes module-level requests functions; swap in the
+        # session method of the same name so connections are reused
+        method = getattr(session, http_method.__name__)
+        own = own_copy()
+        # The copy's instance dict still holds this wrapper, so call the
+        # SDK method through the class
+        return type(own).send_request(own, method, path, *args, **kwargs)
+
+    def isolated_post_stream(*args, **kwargs):
+        own = own_copy()
+        return type(own).post_stream(own, *args, **kwargs)
+
+    http.send_request = pooled_send_request
+    http.post_stream = isolated_post_stream
+
+
+def _use_session(client: Client, session: requests.Session) -> None:
+    """Route a Client, its task handler and the Index objects it returns
+    through session.
+
+    Index.create and the chat completion stream build their own requests
+    calls and still open one-off connections.
+    """
+    _pool(client.http, session)
+    _pool(client.task_handler.http, session)
+    make_index = client.index
+    get_indexes = client.get_indexes
+
+    def index(uid: str):
+        index = make_index(uid)
+        _pool(index.http, session)
+        _pool(index.task_handler.http, session)
+        return index
+
+    def get_index(uid: str):
+        return index(uid).fetch_info()
+
+    def get_indexes_pooled(parameters=None):
+        response = get_indexes(parameters)
+        for index in response["results"]:
+            _pool(index.http, session)
+            _pool(index.task_handler.http, session)
+        return response
+
+    client.index = index
+    client.get_index = get_index
+    client.get_indexes = get_indexes_pooled
+
+
 class MeilisearchClient:
     def __init__(
-        self, url: str = "http://localhost:7700", api_key: Optional[str] = None
+        self,
+        url: str = "http://localhost:7700",
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ):
         """Initialize Meilisearch client"""
         self.url = url
         self.api_key = api_key
+        self.session = session or create_session()
         # Add custom user agent to identify this as Meilisearch MCP
         self.client = Client(
             url, api_key, client_agents=("meilisearch-mcp", f"v{__version__}")
         )
+        _use_session(self.client, self.session)
         self.indexes = IndexManager(self.client)
         self.documents = DocumentManager(self.client)
         self.settings = SettingsManager(self.client)
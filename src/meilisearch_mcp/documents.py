@@ -1,5 +1,53 @@
 from typing import Dict, Any, List, Optional, Union
 from meilisearch import Client
+from meilisearch.index import Index
+
+from .logging import MCPLogger
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+logger = MCPLogger()
+
+
+def _unwrap(document: Any) -> Dict[str, Any]:
+    """Return the fields of a meilisearch Document as a plain dict"""
+    if isinstance(document, dict):
+        return document
+    # Document stores the document fields directly in its instance __dict__,
+    # and the Document itself is discarded, so no copy is needed
+    return vars(document)
+
+
+def _encode_documents(documents: List[Dict[str, Any]]) -> Optional[bytes]:
+    """Serialize documents with orjson, or return None to use the SDK's json"""
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(documents)
+    except TypeError:
+        # e.g. integers beyond 64 bits, which the stdlib json still handles
+        return None
+
+
+def _add_documents(
+    index: Index, documents: List[Dict[str, Any]], primary_key: Optional[str] = None
+) -> Any:
+    """Add documents, sending a pre-encoded payload when possible"""
+    payload = _encode_documents(documents)
+    if payload is None:
+        return index.add_documents(documents, primary_key)
+    return index.add_documents_raw(payload, primary_key, "application/json")
+
+
+def _update_documents(index: Index, documents: List[Dict[str, Any]]) -> Any:
+    """Update documents, sending a pre-encoded payload when possible"""
+    payload = _encode_documents(documents)
+    if payload is None:
+        return index.update_documents(documents)
+    return index.update_documents_raw(payload, content_type="application/json")
 
 
 class DocumentManager:
@@ -19,45 +67,28 @@ class DocumentManager:
         try:
             index = self.client.index(index_uid)
             # Build parameters dict, excluding None values to avoid API errors
-            params = {}
-            if offset is not None:
-                params["offset"] = offset
-            if limit is not None:
-                params["limit"] = limit
-            if fields is not None:
-                params["fields"] = fields
+            params = {
+                key: value
+                for key, value in (
+                    ("offset", offset),
+                    ("limit", limit),
+                    ("fields", fields),
+                )
+                if value is not None
+            }
 
-            result = index.get_documents(params if params else {})
+            result = index.get_documents(params)
 
             # Convert meilisearch model objects to JSON-serializable format
-            if hasattr(result, "__dict__"):
-                result_dict = result.__dict__.copy()
-                # Convert individual document objects in results if they exist
-                if "results" in result_dict and isinstance(
-                    result_dict["results"], list
-                ):
-                    serialized_results = []
-                    for doc in result_dict["results"]:
-                        if hasattr(doc, "__dict__"):
-                            # Extract the actual document data
-                            doc_dict = doc.__dict__.copy()
-                            # Look for private attributes that might contain the actual data
-                            for key, value in doc_dict.items():
-                                if key.startswith("_") and isinstance(value, dict):
-                                    # Use the dict content instead of the wrapper
-                                    serialized_results.append(value)
-                                    break
-                            else:
-                                # If no private dict found, use the object dict directly
-                                serialized_results.append(doc_dict)
-                        else:
-                            serialized_results.append(doc)
-                    result_dict["results"] = serialized_results
-                return result_dict
-            else:
-                return result
+            return {
+                "results": [_unwrap(doc) for doc in result.results],
+                "offset": result.offset,
+                "limit": result.limit,
+                "total": result.total,
+            }
         except Exception as e:
-            raise Exception(f"Failed to get documents: {str(e)}")
+            logger.error(f"Error in get_documents: {e}")
+            raise
 
     def get_document(
         self, index_uid: str, document_id: Union[str, int]
@@ -67,7 +98,8 @@ class DocumentManager:
             index = self.client.index(index_uid)
             return index.get_document(document_id)
         except Exception as e:
-            raise Exception(f"Failed to get document: {str(e)}")
+            logger.error(f"Error in get_document: {e}")
+            raise
 
     def add_documents(
         self,
@@ -78,9 +110,10 @@ class DocumentManager:
         """Add documents to an index"""
         try:
             index = self.client.index(index_uid)
-            return index.add_documents(documents, primary_key)
+            return _add_documents(index, documents, primary_key)
         except Exception as e:
-            raise Exception(f"Failed to add documents: {str(e)}")
+            logger.error(f"Error in add_documents: {e}")
+            raise
 
     def update_documents(
         self, index_uid: str, documents: List[Dict[str, Any]]
@@ -88,9 +121,10 @@ class DocumentManager:
         """Update documents in an index"""
         try:
             index = self.client.index(index_uid)
-            return index.update_documents(documents)
+            return _update_documents(index, documents)
         except Exception as e:
-            raise Exception(f"Failed to update documents: {str(e)}")
+            logger.error(f"Error in update_documents: {e}")
+            raise
 
     def delete_document(
         self, index_uid: str, document_id: Union[str, int]
@@ -100,7 +134,8 @@ class DocumentManager:
             index = self.client.index(index_uid)
             return index.delete_document(document_id)
         except Exception as e:
-            raise Exception(f"Failed to delete document: {str(e)}")
+            logger.error(f"Error in delete_document: {e}")
+            raise
 
     def delete_documents(
         self, index_uid: str, document_ids: List[Union[str, int]]
@@ -110,7 +145,8 @@ class DocumentManager:
             index = self.client.index(index_uid)
             return index.delete_documents(document_ids)
         except Exception as e:
-            raise Exception(f"Failed to delete documents: {str(e)}")
+            logger.error(f"Error in delete_documents: {e}")
+            raise
 
     def delete_all_documents(self, index_uid: str) -> Dict[str, Any]:
         """Delete all documents in an index"""
@@ -118,4 +154,5 @@ class DocumentManager:
             index = self.client.index(index_uid)
             return index.delete_all_documents()
         except Exception as e:
-            raise Exception(f"Failed to delete all documents: {str(e)}")
+            logger.error(f"Error in delete_all_documents: {e}")
+            raise
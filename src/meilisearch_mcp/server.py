@@ -8,7 +8,7 @@ from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 
-from .client import MeilisearchClient
+from .client import MeilisearchClient, create_session
 from .chat import ChatManager
 from .logging import MCPLogger
 
@@ -47,7 +47,8 @@ class MeilisearchMCPServer:
         self.logger = MCPLogger("meilisearch-mcp", log_dir)
         self.url = url
         self.api_key = api_key
-        self.meili_client = MeilisearchClient(url, api_key)
+        self.session = create_session()
+        self.meili_client = MeilisearchClient(url, api_key, session=self.session)
         self.chat_manager = ChatManager(self.meili_client.client)
         self.server = Server("meilisearch")
         self._setup_handlers()
@@ -61,10 +62,28 @@ class MeilisearchMCPServer:
         if api_key:
             self.api_key = api_key
 
-        self.meili_client = MeilisearchClient(self.url, self.api_key)
+        self.meili_client = MeilisearchClient(
+            self.url, self.api_key, session=self.session
+        )
         self.chat_manager = ChatManager(self.meili_client.client)
         self.logger.info("Updated Meilisearch connection settings", url=self.url)
 
+    def _progress_token(self) -> Optional[Union[str, int]]:
+        """Return the progress token of the current request, if any"""
+        try:
+            meta = self.server.request_context.meta
+        except LookupError:
+            return None
+        return meta.progressToken if meta else None
+
+    async def _send_progress(
+        self, progress_token: Union[str, int], progress: float, message: str
+    ):
+        """Send a progress notification for the current request"""
+        await self.server.request_context.session.send_progress_notification(
+            progress_token, progress, message=message
+        )
+
     def _setup_handlers(self):
         """Setup MCP request handlers"""
 
@@ -523,7 +542,8 @@ class MeilisearchMCPServer:
                     # Use default values to fix None parameter issues (related to issue #17)
                     offset = arguments.get("offset", 0)
                     limit = arguments.get("limit", 20)
-                    documents = self.meili_client.documents.get_documents(
+                    documents = await asyncio.to_thread(
+                        self.meili_client.documents.get_documents,
                         arguments["indexUid"],
                         offset,
                         limit,
@@ -539,7 +559,8 @@ class MeilisearchMCPServer:
                     ]
 
                 elif name == "add-documents":
-                    result = self.meili_client.documents.add_documents(
+                    result = await asyncio.to_thread(
+                        self.meili_client.documents.add_documents,
                         arguments["indexUid"],
                         arguments["documents"],
                         arguments.get("primaryKey"),
@@ -716,11 +737,25 @@ class MeilisearchMCPServer:
                     ]
 
                 elif name == "create-chat-completion":
+                    # Report each received chunk as a progress notification when
+                    # the client asked for them, so it can tell the call is alive
+                    progress_token = self._progress_token()
+                    on_chunk = None
+                    if progress_token is not None:
+
+                        async def on_chunk(chunk_count: int):
+                            await self._send_progress(
+                                progress_token,
+                                chunk_count,
+                                f"Received {chunk_count} chat completion chunks",
+                            )
+
                     response = await self.chat_manager.create_chat_completion(
                         workspace_uid=arguments["workspace_uid"],
                         messages=arguments["messages"],
                         model=arguments.get("model", "gpt-3.5-turbo"),
                         stream=arguments.get("stream", True),
+                        on_chunk=on_chunk,
                     )
                     return [
                         types.TextContent(
@@ -807,6 +842,7 @@ class MeilisearchMCPServer:
     def cleanup(self):
         """Clean shutdown"""
         self.logger.info("Shutting down MCP server")
+        self.session.close()
         self.logger.shutdown()
 
 
@@ -816,7 +852,10 @@ def main():
     api_key = os.getenv("MEILI_MASTER_KEY")
 
     server = create_server(url, api_key)
-    asyncio.run(server.run())
+    try:
+        asyncio.run(server.run())
+    finally:
+        server.cleanup()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+"""Shared helpers for tests that need a local Docker daemon."""
+
+import functools
+import shutil
+import subprocess
+
+
+@functools.lru_cache(maxsize=1)
+def docker_available():
+    """Check if Docker is available on the system."""
+    if not shutil.which("docker"):
+        return False
+    # Try to run docker version to ensure it's working
+    try:
+        result = subprocess.run(
+            ["docker", "version"], capture_output=True, text=True, timeout=5
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
@@ -0,0 +1,91 @@
+import os
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+import pytest_asyncio
+import requests
+from mcp.types import ListToolsRequest
+from meilisearch import Client
+
+from src.meilisearch_mcp.server import MeilisearchMCPServer, create_server
+
+_MEILI_URL = os.getenv("MEILI_HTTP_ADDR", "http://localhost:7700")
+_MEILI_KEY = os.getenv("MEILI_MASTER_KEY")
+
+# list_tools takes no arguments, so one request object serves every call
+_LIST_TOOLS_REQUEST = ListToolsRequest(method="tools/list")
+
+_SERVER_CACHE: Dict[Tuple[str, Optional[str]], MeilisearchMCPServer] = {}
+
+
+def get_cached_server(url: str, api_key: Optional[str]) -> MeilisearchMCPServer:
+    """Return the session's server for these connection settings, creating it once"""
+    key = (url, api_key)
+    server = _SERVER_CACHE.get(key)
+    if server is None:
+        server = _SERVER_CACHE[key] = create_server(url, api_key)
+    return server
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Shut down every server handed out by get_cached_server"""
+    for server in _SERVER_CACHE.values():
+        server.cleanup()
+    _SERVER_CACHE.clear()
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """Share one MCP server instance across the whole test session"""
+    return get_cached_server(_MEILI_URL, _MEILI_KEY)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def tools_list(mcp_server):
+    """List the server's tools once; the registry is static per server"""
+    handler = mcp_server.server.request_handlers[ListToolsRequest]
+    result = await handler(_LIST_TOOLS_REQUEST)
+    return result.root.tools
+
+
+@pytest.fixture(scope="session")
+def tools_by_name(tools_list):
+    """Index the cached tool list by tool name"""
+    return {tool.name: tool for tool in tools_list}
+
+
+@pytest.fixture(scope="session")
+def meili_available():
+    """Probe Meilisearch once with a short timeout"""
+    parts = urlsplit(_MEILI_URL)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        pytest.fail(f"MEILI_HTTP_ADDR is not a valid URL: {_MEILI_URL!r}")
+
+    client = Client(_MEILI_URL, _MEILI_KEY, timeout=0.5)
+    return client.is_healthy()
+
+
+@pytest.fixture
+def requires_meilisearch(meili_available):
+    """Skip the requesting test when no Meilisearch instance is reachable"""
+    if not meili_available:
+        pytest.skip("Meilisearch not running")
+
+
+class _RecordingSession(requests.Session):
+    """Session that records each request instead of sending it"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def request(self, method, url, *args, **kwargs):
+        self.calls.append((method, url, kwargs.get("headers")))
+        raise requests.exceptions.ConnectionError("not sent")
+
+
+@pytest.fixture
+def recording_session():
+    """HTTP session that records requests and fails them without sending"""
+    return _RecordingSession()
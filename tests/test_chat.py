@@ -1,86 +1,129 @@
+import asyncio
+import threading
+
 import pytest
-from datetime import datetime
-from unittest.mock import MagicMock, Mock
+from types import SimpleNamespace
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+from mcp.types import CallToolRequest, CallToolRequestParams, RequestParams
 from meilisearch.errors import MeilisearchApiError
 
-from src.meilisearch_mcp.server import MeilisearchMCPServer
+from src.meilisearch_mcp.chat import ChatManager
 
 
 @pytest.fixture
-def server():
-    return MeilisearchMCPServer(url="http://localhost:7700", api_key="test_key")
+def server(mcp_server, monkeypatch):
+    """Shared session server with a fresh chat manager for each test"""
+    monkeypatch.setattr(
+        mcp_server, "chat_manager", ChatManager(mcp_server.meili_client.client)
+    )
+    return mcp_server
+
+
+def mock_chat_completion(*args, **kwargs):
+    """Simulate streaming response chunks"""
+    chunks = [
+        {"choices": [{"delta": {"content": "This is "}}]},
+        {"choices": [{"delta": {"content": "a test "}}]},
+        {"choices": [{"delta": {"content": "response."}}]},
+        {"choices": [{"delta": {}, "finish_reason": "stop"}]},
+    ]
+    for chunk in chunks:
+        yield chunk
+
+
+class _StubChatClient:
+    """Minimal stand-in for the Meilisearch client's chat methods"""
+
+    create_chat_completion = staticmethod(mock_chat_completion)
+
+    def __init__(self):
+        self.settings_calls = 0
+        self.workspaces_calls = 0
+
+    def get_chat_workspaces(self, offset=None, limit=None):
+        self.workspaces_calls += 1
+        return {
+            "results": [
+                {"uid": "workspace1", "name": "Customer Support"},
+                {"uid": "workspace2", "name": "Documentation"},
+            ],
+            "limit": 10,
+            "offset": 0,
+            "total": 2,
+        }
+
+    def get_chat_workspace_settings(self, workspace_uid):
+        self.settings_calls += 1
+        return {
+            "model": "gpt-3.5-turbo",
+            "indexUids": ["products", "docs"],
+            "temperature": 0.7,
+        }
+
+    def update_chat_workspace_settings(self, workspace_uid, settings):
+        return {
+            "model": "gpt-4",
+            "indexUids": ["products", "docs"],
+            "temperature": 0.5,
+        }
+
+
+class _RacingChatClient:
+    """Chat client whose reads return the value seen before a concurrent update"""
+
+    def __init__(self):
+        self.model = "old"
+        self.read_started = threading.Event()
+        self.update_done = threading.Event()
+
+    def get_chat_workspaces(self, offset=None, limit=None):
+        workspaces = {"results": [{"uid": "workspace1", "model": self.model}]}
+        self.read_started.set()
+        self.update_done.wait(5)
+        return workspaces
+
+    def get_chat_workspace_settings(self, workspace_uid):
+        settings = {"model": self.model}
+        self.read_started.set()
+        self.update_done.wait(5)
+        return settings
+
+    def update_chat_workspace_settings(self, workspace_uid, settings):
+        self.read_started.wait(5)
+        self.model = settings["model"]
+        self.update_done.set()
+        return {"model": self.model}
+
+
+class _ProgressRecorder:
+    """Stand-in for the request session that records progress notifications"""
+
+    def __init__(self):
+        self.notifications = []
+
+    async def send_progress_notification(self, progress_token, progress, message=None):
+        self.notifications.append((progress_token, progress, message))
 
 
 @pytest.fixture
 def setup_mock_chat_client(server):
-    """Mock the Meilisearch client for chat-related methods"""
-    # Create a mock client with chat methods
-    mock_client = MagicMock()
-
-    # Mock create_chat_completion to return an iterator
-    def mock_chat_completion(*args, **kwargs):
-        # Simulate streaming response chunks
-        chunks = [
-            {"choices": [{"delta": {"content": "This is "}}]},
-            {"choices": [{"delta": {"content": "a test "}}]},
-            {"choices": [{"delta": {"content": "response."}}]},
-        ]
-        for chunk in chunks:
-            yield chunk
-
-    mock_client.create_chat_completion = mock_chat_completion
-
-    # Mock get_chat_workspaces
-    mock_client.get_chat_workspaces.return_value = {
-        "results": [
-            {"uid": "workspace1", "name": "Customer Support"},
-            {"uid": "workspace2", "name": "Documentation"},
-        ],
-        "limit": 10,
-        "offset": 0,
-        "total": 2,
-    }
-
-    # Mock get_chat_workspace_settings
-    mock_client.get_chat_workspace_settings.return_value = {
-        "model": "gpt-3.5-turbo",
-        "indexUids": ["products", "docs"],
-        "temperature": 0.7,
-    }
-
-    # Mock update_chat_workspace_settings
-    mock_client.update_chat_workspace_settings.return_value = {
-        "model": "gpt-4",
-        "indexUids": ["products", "docs"],
-        "temperature": 0.5,
-    }
-
-    # Replace the chat manager's client
-    server.chat_manager.client = mock_client
+    """Replace the chat manager's client with a stub"""
+    server.chat_manager.client = _StubChatClient()
     return server
 
 
 async def simulate_tool_call(server, tool_name, arguments=None):
     """Simulate a tool call directly on the server"""
-    handlers = {}
-
-    # Get the tool handler
-    @server.server.call_tool()
-    async def handle_call_tool(name, arguments_=None):
-        pass
-
-    # The handler is registered, now call it directly
-    result = await server._setup_handlers.__code__.co_consts[1](tool_name, arguments)
-
-    # Actually call the handler through the server's method
-    handler_func = None
-    for name, obj in server.__class__.__dict__.items():
-        if hasattr(obj, "__name__") and obj.__name__ == "handle_call_tool":
-            handler_func = obj
-            break
-
-    # Call the actual handle_call_tool method
-    return await server._MeilisearchMCPServer__handle_call_tool(tool_name, arguments)
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest.model_construct(
+        method="tools/call",
+        params=CallToolRequestParams.model_construct(
+            name=tool_name, arguments=arguments or {}
+        ),
+    )
+    result = await handler(request)
+    return result.root.content
 
 
 class TestChatTools:
@@ -102,6 +145,95 @@ class TestChatTools:
         # The result should be the combined response
         assert result == "This is a test response."
 
+    @pytest.mark.asyncio
+    async def test_stream_chat_completion(self, setup_mock_chat_client):
+        """Test that chat completion content is yielded chunk by chunk"""
+        server = setup_mock_chat_client
+
+        parts = [
+            part
+            async for part in server.chat_manager.stream_chat_completion(
+                workspace_uid="test-workspace",
+                messages=[{"role": "user", "content": "What is Meilisearch?"}],
+            )
+        ]
+
+        assert parts == ["This is ", "a test ", "response."]
+
+    @pytest.mark.asyncio
+    async def test_create_chat_completion_tool(self, setup_mock_chat_client):
+        """Test the create-chat-completion tool returns the combined response"""
+        result = await simulate_tool_call(
+            setup_mock_chat_client,
+            "create-chat-completion",
+            {
+                "workspace_uid": "test-workspace",
+                "messages": [{"role": "user", "content": "What is Meilisearch?"}],
+            },
+        )
+
+        assert result[0].text == "Chat completion response:\nThis is a test response."
+
+    @pytest.mark.asyncio
+    async def test_create_chat_completion_tool_reports_progress(
+        self, setup_mock_chat_client
+    ):
+        """Test that each chunk is reported when the call has a progressToken"""
+        recorder = _ProgressRecorder()
+        context = RequestContext(
+            request_id=1,
+            meta=RequestParams.Meta(progressToken="chat"),
+            session=recorder,
+            lifespan_context=None,
+        )
+        token = request_ctx.set(context)
+        try:
+            result = await simulate_tool_call(
+                setup_mock_chat_client,
+                "create-chat-completion",
+                {
+                    "workspace_uid": "test-workspace",
+                    "messages": [{"role": "user", "content": "What is Meilisearch?"}],
+                },
+            )
+        finally:
+            request_ctx.reset(token)
+
+        assert result[0].text == "Chat completion response:\nThis is a test response."
+        assert [(t, p) for t, p, _ in recorder.notifications] == [
+            ("chat", 1),
+            ("chat", 2),
+            ("chat", 3),
+        ]
+        assert recorder.notifications[-1][2] == "Received 3 chat completion chunks"
+
+    @pytest.mark.asyncio
+    async def test_stream_is_closed_when_consumer_fails(self, setup_mock_chat_client):
+        """Test that the SDK stream is closed if a chunk callback raises"""
+        chat_manager = setup_mock_chat_client.chat_manager
+        closed = []
+
+        def tracking_chat_completion(*args, **kwargs):
+            try:
+                yield {"choices": [{"delta": {"content": "This is "}}]}
+                yield {"choices": [{"delta": {"content": "a test "}}]}
+            finally:
+                closed.append(True)
+
+        chat_manager.client.create_chat_completion = tracking_chat_completion
+
+        async def on_chunk(chunk_count):
+            raise ConnectionError("client went away")
+
+        with pytest.raises(ConnectionError):
+            await chat_manager.create_chat_completion(
+                workspace_uid="test-workspace",
+                messages=[{"role": "user", "content": "What is Meilisearch?"}],
+                on_chunk=on_chunk,
+            )
+
+        assert closed == [True]
+
     @pytest.mark.asyncio
     async def test_get_chat_workspaces(self, setup_mock_chat_client):
         """Test getting chat workspaces"""
@@ -140,19 +272,88 @@ class TestChatTools:
         assert result["model"] == "gpt-4"
         assert result["temperature"] == 0.5
 
+    @pytest.mark.asyncio
+    async def test_chat_workspace_settings_are_cached(self, setup_mock_chat_client):
+        """Test that settings reads are cached until the workspace is updated"""
+        server = setup_mock_chat_client
+        chat_manager = server.chat_manager
+
+        await chat_manager.get_chat_workspace_settings(workspace_uid="workspace1")
+        await chat_manager.get_chat_workspace_settings(workspace_uid="workspace1")
+        assert chat_manager.client.settings_calls == 1
+
+        await chat_manager.update_chat_workspace_settings(
+            workspace_uid="workspace1", settings={"model": "gpt-4"}
+        )
+        await chat_manager.get_chat_workspace_settings(workspace_uid="workspace1")
+        assert chat_manager.client.settings_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_chat_workspaces_are_cached(self, setup_mock_chat_client):
+        """Test that workspace listings are cached per page until an update"""
+        chat_manager = setup_mock_chat_client.chat_manager
+
+        await chat_manager.get_chat_workspaces()
+        await chat_manager.get_chat_workspaces()
+        await chat_manager.get_chat_workspaces(offset=10)
+        assert chat_manager.client.workspaces_calls == 2
+
+        await chat_manager.update_chat_workspace_settings(
+            workspace_uid="workspace1", settings={"model": "gpt-4"}
+        )
+        await chat_manager.get_chat_workspaces()
+        assert chat_manager.client.workspaces_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_read_racing_an_update_is_not_cached(self, server):
+        """Test that a read overtaken by an update does not refill the cache"""
+        chat_manager = server.chat_manager
+        chat_manager.client = _RacingChatClient()
+
+        await asyncio.gather(
+            chat_manager.get_chat_workspace_settings(workspace_uid="workspace1"),
+            chat_manager.update_chat_workspace_settings(
+                workspace_uid="workspace1", settings={"model": "new"}
+            ),
+        )
+
+        settings = await chat_manager.get_chat_workspace_settings(
+            workspace_uid="workspace1"
+        )
+        assert settings == {"model": "new"}
+
+    @pytest.mark.asyncio
+    async def test_workspaces_read_racing_an_update_is_not_cached(self, server):
+        """Test that a workspace listing overtaken by an update is not cached"""
+        chat_manager = server.chat_manager
+        chat_manager.client = _RacingChatClient()
+
+        await asyncio.gather(
+            chat_manager.get_chat_workspaces(),
+            chat_manager.update_chat_workspace_settings(
+                workspace_uid="workspace1", settings={"model": "new"}
+            ),
+        )
+
+        workspaces = await chat_manager.get_chat_workspaces()
+        assert workspaces["results"][0]["model"] == "new"
+
     @pytest.mark.asyncio
     async def test_chat_completion_error_handling(self, server):
         """Test error handling in chat completion"""
-        # Mock the client to raise an error
-        server.chat_manager.client = MagicMock()
-        # Create a mock request object for the error with proper JSON text
-        mock_request = MagicMock()
-        mock_request.status_code = 400
-        mock_request.text = '{"message": "Chat feature not enabled", "code": "chat_not_enabled", "type": "invalid_request", "link": "https://docs.meilisearch.com/errors#chat_not_enabled"}'
-        server.chat_manager.client.create_chat_completion.side_effect = (
-            MeilisearchApiError("Chat feature not enabled", mock_request)
+        # Create a stub request object for the error with proper JSON text
+        mock_request = SimpleNamespace(
+            status_code=400,
+            text='{"message": "Chat feature not enabled", "code": "chat_not_enabled", "type": "invalid_request", "link": "https://docs.meilisearch.com/errors#chat_not_enabled"}',
         )
 
+        def failing_chat_completion(*args, **kwargs):
+            raise MeilisearchApiError("Chat feature not enabled", mock_request)
+
+        # Stub the client to raise an error
+        server.chat_manager.client = _StubChatClient()
+        server.chat_manager.client.create_chat_completion = failing_chat_completion
+
         with pytest.raises(MeilisearchApiError):
             await server.chat_manager.create_chat_completion(
                 workspace_uid="test",
@@ -162,8 +363,8 @@ class TestChatTools:
     @pytest.mark.asyncio
     async def test_empty_chat_response(self, server):
         """Test handling empty chat response"""
-        # Mock empty response
-        server.chat_manager.client = MagicMock()
+        # Stub empty response
+        server.chat_manager.client = _StubChatClient()
 
         def mock_empty_completion(*args, **kwargs):
             # Return empty chunks
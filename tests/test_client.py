@@ -0,0 +1,38 @@
+import pytest
+from meilisearch.errors import MeilisearchCommunicationError
+
+from src.meilisearch_mcp.client import MeilisearchClient
+
+
+def test_meilisearch_client_routes_requests_through_session(recording_session):
+    """Test that client, index and task requests all use the given session"""
+    client = MeilisearchClient(
+        url="http://localhost:7700", session=recording_session
+    ).client
+
+    for call in (
+        client.get_indexes,
+        client.get_tasks,
+        lambda: client.get_index("movies"),
+        lambda: client.index("movies").get_stats(),
+        lambda: client.index("movies").get_tasks(),
+    ):
+        with pytest.raises(MeilisearchCommunicationError):
+            call()
+
+    assert len(recording_session.calls) == 5
+    assert all(method == "GET" for method, _, _ in recording_session.calls)
+
+
+def test_requests_do_not_share_headers(recording_session):
+    """Test that a request's Content-Type is not left on the shared headers"""
+    client = MeilisearchClient(
+        url="http://localhost:7700", session=recording_session
+    ).client
+
+    with pytest.raises(MeilisearchCommunicationError):
+        client.http.post("keys", {"actions": ["search"]})
+
+    _, _, headers = recording_session.calls[0]
+    assert headers["Content-Type"] == "application/json"
+    assert "Content-Type" not in client.http.headers
@@ -6,50 +6,36 @@ These tests verify that the Docker image can be built successfully.
 
 import subprocess
 import pytest
-import shutil
-
-
-# Check if Docker is available
-def docker_available():
-    """Check if Docker is available on the system."""
-    if not shutil.which("docker"):
-        return False
-    # Try to run docker version to ensure it's working
-    try:
-        result = subprocess.run(
-            ["docker", "version"], capture_output=True, text=True, timeout=5
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
 
+from tests._docker_utils import docker_available
 
 # Skip all tests in this module if Docker is not available
 pytestmark = pytest.mark.skipif(
     not docker_available(), reason="Docker not available on this system"
 )
 
+DOCKER_TEST_IMAGE = "meilisearch-mcp-test"
 
-def test_docker_build():
-    """Test that the Docker image can be built successfully."""
-    result = subprocess.run(
-        ["docker", "build", "-t", "meilisearch-mcp-test", "."],
+
+@pytest.fixture(scope="module")
+def docker_build():
+    """Build the Docker image once and share the build result across tests"""
+    return subprocess.run(
+        ["docker", "build", "-t", DOCKER_TEST_IMAGE, "."],
         capture_output=True,
         text=True,
     )
-    assert result.returncode == 0, f"Docker build failed: {result.stderr}"
 
 
-def test_docker_image_runs():
+def test_docker_build(docker_build):
+    """Test that the Docker image can be built successfully."""
+    assert docker_build.returncode == 0, f"Docker build failed: {docker_build.stderr}"
+
+
+def test_docker_image_runs(docker_build):
     """Test that the Docker image can run and show help."""
-    # First build the image
-    build_result = subprocess.run(
-        ["docker", "build", "-t", "meilisearch-mcp-test", "."],
-        capture_output=True,
-        text=True,
-    )
-    if build_result.returncode != 0:
-        pytest.skip(f"Docker build failed: {build_result.stderr}")
+    if docker_build.returncode != 0:
+        pytest.skip(f"Docker build failed: {docker_build.stderr}")
 
     # Try to run the container and check it starts
     result = subprocess.run(
@@ -61,7 +47,7 @@ def test_docker_image_runs():
             "MEILI_HTTP_ADDR=http://localhost:7700",
             "-e",
             "MEILI_MASTER_KEY=test",
-            "meilisearch-mcp-test",
+            DOCKER_TEST_IMAGE,
             "python",
             "-c",
             "import src.meilisearch_mcp; print('MCP module loaded successfully')",
@@ -0,0 +1,122 @@
+import json
+
+import pytest
+from meilisearch.models.document import DocumentsResults
+
+from src.meilisearch_mcp import documents as documents_module
+from src.meilisearch_mcp.documents import DocumentManager
+
+
+class _StubIndex:
+    def __init__(self):
+        self.added = []
+        self.updated = []
+        self.raw_payloads = []
+        self.documents = [
+            {"id": 1, "title": "Carol", "_geo": {"lat": 45.5, "lng": -73.6}},
+            {"id": 2, "title": "Wonder Woman"},
+        ]
+
+    def get_documents(self, parameters=None):
+        parameters = parameters or {}
+        offset = parameters.get("offset", 0)
+        limit = parameters.get("limit", 20)
+        return DocumentsResults(
+            {
+                "results": self.documents[offset : offset + limit],
+                "offset": offset,
+                "limit": limit,
+                "total": len(self.documents),
+            }
+        )
+
+    def add_documents(self, documents, primary_key=None):
+        self.added.append((documents, primary_key))
+        return {"taskUid": len(self.added)}
+
+    def add_documents_raw(self, payload, primary_key=None, content_type=None):
+        self.raw_payloads.append(payload)
+        return self.add_documents(json.loads(payload), primary_key)
+
+    def update_documents_raw(self, payload, primary_key=None, content_type=None):
+        self.raw_payloads.append(payload)
+        return self.update_documents(json.loads(payload))
+
+    def update_documents(self, documents):
+        self.updated.append(documents)
+        return {"taskUid": len(self.updated)}
+
+
+class _StubClient:
+    def __init__(self):
+        self.stub_index = _StubIndex()
+
+    def index(self, uid):
+        return self.stub_index
+
+
+@pytest.fixture
+def client():
+    return _StubClient()
+
+
+@pytest.fixture
+def manager(client):
+    return DocumentManager(client)
+
+
+class TestGetDocuments:
+    def test_get_documents_returns_plain_dicts(self, manager):
+        """Test that Document objects are unwrapped into their fields"""
+        result = manager.get_documents("movies", offset=0, limit=10)
+
+        assert result == {
+            "results": [
+                {"id": 1, "title": "Carol", "_geo": {"lat": 45.5, "lng": -73.6}},
+                {"id": 2, "title": "Wonder Woman"},
+            ],
+            "offset": 0,
+            "limit": 10,
+            "total": 2,
+        }
+
+    def test_get_documents_preserves_error_type(self, manager, client):
+        """Test that SDK errors propagate unchanged to the caller"""
+
+        def fail(parameters=None):
+            raise ConnectionError("Meilisearch unreachable")
+
+        client.stub_index.get_documents = fail
+
+        with pytest.raises(ConnectionError, match="Meilisearch unreachable"):
+            manager.get_documents("movies")
+
+
+class TestDocumentEncoding:
+    def test_add_documents_sends_orjson_payload(self, manager, client):
+        """Test that uploads are pre-encoded when orjson is installed"""
+        pytest.importorskip("orjson")
+
+        manager.add_documents("movies", [{"id": 1}], "id")
+
+        assert client.stub_index.raw_payloads == [b'[{"id":1}]']
+        assert client.stub_index.added == [([{"id": 1}], "id")]
+
+    def test_add_documents_falls_back_on_type_error(self, manager, client):
+        """Test that documents orjson rejects are sent through the SDK's json"""
+        pytest.importorskip("orjson")
+        documents = [{"id": 1, "views": 2**70}]
+
+        manager.add_documents("movies", documents)
+
+        assert client.stub_index.raw_payloads == []
+        assert client.stub_index.added == [(documents, None)]
+
+    def test_update_documents_without_orjson(self, manager, client, monkeypatch):
+        """Test that updates use the SDK's json when orjson is not installed"""
+        monkeypatch.setattr(documents_module, "orjson", None)
+
+        manager.update_documents("movies", [{"id": 1}])
+
+        assert client.stub_index.raw_payloads == []
+        assert client.stub_index.updated == [[{"id": 1}]]
@@ -9,29 +9,121 @@ The tests require a running Meilisearch instance in the background.
 """
 
 import asyncio
-import json
+import functools
 import os
+import re
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+import orjson
 import pytest
-from unittest.mock import AsyncMock, patch
+import pytest_asyncio
 
-from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
-from src.meilisearch_mcp.server import MeilisearchMCPServer, create_server
+from mcp.types import CallToolRequest, CallToolRequestParams
+from meilisearch.errors import MeilisearchCommunicationError
+from src.meilisearch_mcp.server import MeilisearchMCPServer
 
 
 # Test configuration constants
 INDEXING_WAIT_TIME = 0.5
-TEST_URL = "http://localhost:7700"
+TASK_WAIT_TIMEOUT = 5.0
+TASK_UID_PATTERN = re.compile(r"task_uid=(\d+)")
+TASK_STATUS_PATTERN = re.compile(r"'status': '(\w+)'")
+# Single-scan check for issue #16: Python reprs must be absent, content present
+ISSUE16_PATTERN = re.compile(
+    r"(?P<object_repr><meilisearch\.models\.document\.DocumentsResults object at)"
+    r"|(?P<results_repr>DocumentsResults)"
+    r"|(?P<title>Test Document)"
+    r"|(?P<content>Test content)"
+)
 ALT_TEST_URL = "http://localhost:7701"
 ALT_TEST_URL_2 = "http://localhost:7702"
 TEST_API_KEY = "test_api_key_123"
 FINAL_TEST_KEY = "final_test_key"
 
+# Complete set of expected tools (26 total - includes 4 new chat tools)
+EXPECTED_TOOLS = frozenset(
+    {
+        "get-connection-settings",
+        "update-connection-settings",
+        "health-check",
+        "get-version",
+        "get-stats",
+        "create-index",
+        "list-indexes",
+        "delete-index",
+        "get-documents",
+        "add-documents",
+        "get-settings",
+        "update-settings",
+        "search",
+        "get-task",
+        "get-tasks",
+        "cancel-tasks",
+        "get-keys",
+        "create-key",
+        "delete-key",
+        "get-health-status",
+        "get-index-metrics",
+        "get-system-info",
+        # New chat tools added in v0.6.0
+        "create-chat-completion",
+        "get-chat-workspaces",
+        "get-chat-workspace-settings",
+        "update-chat-workspace-settings",
+    }
+)
+
+# Tool categories for MCP client organization, as (category, predicate) pairs
+CATEGORY_RULES = (
+    ("connection", lambda name: "connection" in name),
+    ("index", lambda name: "index" in name),
+    ("document", lambda name: "document" in name),
+    ("search", lambda name: "search" in name),
+    ("task", lambda name: "task" in name),
+    ("key", lambda name: "key" in name),
+    (
+        "monitoring",
+        lambda name: any(
+            word in name for word in ("health", "stats", "version", "system", "metrics")
+        ),
+    ),
+    ("chat", lambda name: "chat" in name),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _categorize(names: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Group tool names by CATEGORY_RULES in a single pass over the names"""
+    categories: Dict[str, List[str]] = {}
+    for name in names:
+        for category, matches in CATEGORY_RULES:
+            if matches(name):
+                categories.setdefault(category, []).append(name)
+    return {category: tuple(members) for category, members in categories.items()}
+
+
+ESSENTIAL_TOOLS = frozenset(
+    {
+        "get-connection-settings",
+        "update-connection-settings",
+        "health-check",
+        "get-version",
+        "get-stats",
+        "create-index",
+        "list-indexes",
+        "get-documents",
+        "add-documents",
+        "search",
+        "get-settings",
+        "update-settings",
+    }
+)
+
 
 def generate_unique_index_name(prefix: str = "test") -> str:
-    """Generate a unique index name for testing"""
-    return f"{prefix}_{int(time.time() * 1000)}"
+    """Generate a unique index name for testing, namespaced per xdist worker"""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return f"{prefix}_{worker}_{int(time.time() * 1e6)}"
 
 
 async def wait_for_indexing() -> None:
@@ -47,24 +139,43 @@ async def simulate_mcp_call(
     if not handler:
         raise RuntimeError("No call_tool handler found")
 
-    request = CallToolRequest(
+    # Inputs are literals built here, so skip pydantic validation
+    request = CallToolRequest.model_construct(
         method="tools/call",
-        params=CallToolRequestParams(name=tool_name, arguments=arguments or {}),
+        params=CallToolRequestParams.model_construct(
+            name=tool_name, arguments=arguments or {}
+        ),
     )
 
     result = await handler(request)
     return result.root.content
 
 
-async def simulate_list_tools(server: MeilisearchMCPServer) -> List[Any]:
-    """Simulate an MCP client request to list tools"""
-    handler = server.server.request_handlers.get(ListToolsRequest)
-    if not handler:
-        raise RuntimeError("No list_tools handler found")
+async def run_tool_matrix(
+    server: MeilisearchMCPServer, calls: List[Tuple[str, Dict[str, Any]]]
+) -> List[List[Any]]:
+    """Run independent tool calls concurrently, returning results in call order"""
+    return await asyncio.gather(
+        *(simulate_mcp_call(server, name, arguments) for name, arguments in calls)
+    )
 
-    request = ListToolsRequest(method="tools/list")
-    result = await handler(request)
-    return result.root.tools
+
+async def _wait_for_task(
+    server: MeilisearchMCPServer, task_uid: int, timeout: float = TASK_WAIT_TIMEOUT
+) -> str:
+    """Poll a Meilisearch task until it finishes, backing off from 10ms to 100ms"""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        result = await simulate_mcp_call(server, "get-task", {"taskUid": task_uid})
+        match = TASK_STATUS_PATTERN.search(result[0].text)
+        status = match.group(1) if match else None
+        if status in ("succeeded", "failed", "canceled"):
+            return status
+        if time.monotonic() >= deadline:
+            pytest.fail(f"Task {task_uid} did not finish within {timeout}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.1)
 
 
 async def create_test_index_with_documents(
@@ -72,10 +183,12 @@ async def create_test_index_with_documents(
 ) -> None:
     """Helper to create index and add documents for testing"""
     await simulate_mcp_call(server, "create-index", {"uid": index_name})
-    await simulate_mcp_call(
+    add_result = await simulate_mcp_call(
         server, "add-documents", {"indexUid": index_name, "documents": documents}
     )
-    await wait_for_indexing()
+    match = TASK_UID_PATTERN.search(add_result[0].text)
+    assert match, f"add-documents returned no task: {add_result[0].text}"
+    assert await _wait_for_task(server, int(match.group(1))) == "succeeded"
 
 
 def assert_text_content_response(
@@ -93,24 +206,49 @@ def assert_text_content_response(
     return text
 
 
-@pytest.fixture
-async def mcp_server():
-    """Shared fixture for creating MCP server instances"""
-    url = os.getenv("MEILI_HTTP_ADDR", TEST_URL)
-    api_key = os.getenv("MEILI_MASTER_KEY")
+@pytest.fixture(autouse=True)
+def restore_connection_settings(mcp_server):
+    """Undo connection changes so the session-scoped server stays reusable"""
+    saved = {
+        attr: getattr(mcp_server, attr)
+        for attr in ("url", "api_key", "meili_client", "chat_manager")
+    }
+    yield
+    for attr, value in saved.items():
+        setattr(mcp_server, attr, value)
+
+
+class _CountingFake:
+    """Callable stand-in that returns a fixed value and counts its calls"""
+
+    def __init__(self, return_value: Any):
+        self.return_value = return_value
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs) -> Any:
+        self.calls += 1
+        return self.return_value
 
-    server = create_server(url, api_key)
-    yield server
-    server.cleanup()
+
+@pytest_asyncio.fixture(scope="class")
+async def populated_index(mcp_server, meili_available):
+    """Create one index with documents shared by every test in a class"""
+    if not meili_available:
+        pytest.skip("Meilisearch not running")
+
+    test_index = generate_unique_index_name("test_issue17")
+    test_documents = [{"id": i, "title": f"Document {i}"} for i in range(1, 6)]
+
+    await create_test_index_with_documents(mcp_server, test_index, test_documents)
+    return test_index
 
 
 class TestMCPClientIntegration:
     """Test MCP client interaction with the server"""
 
-    async def test_tool_discovery(self, mcp_server):
+    async def test_tool_discovery(self, tools_list):
         """Test that MCP client can discover all available tools from the server"""
-        # Simulate MCP list_tools request
-        tools = await simulate_list_tools(mcp_server)
+        tools = tools_list
 
         tool_names = [tool.name for tool in tools]
 
@@ -119,23 +257,8 @@ class TestMCPClientIntegration:
         assert len(tools) > 0
 
         # Check for essential tools
-        essential_tools = [
-            "get-connection-settings",
-            "update-connection-settings",
-            "health-check",
-            "get-version",
-            "get-stats",
-            "create-index",
-            "list-indexes",
-            "get-documents",
-            "add-documents",
-            "search",
-            "get-settings",
-            "update-settings",
-        ]
-
-        for tool_name in essential_tools:
-            assert tool_name in tool_names, f"Essential tool '{tool_name}' not found"
+        missing = ESSENTIAL_TOOLS - set(tool_names)
+        assert not missing, f"Essential tools not found: {sorted(missing)}"
 
         # Verify tool structure
         for tool in tools:
@@ -174,17 +297,16 @@ class TestMCPClientIntegration:
         verify_text = assert_text_content_response(verify_result)
         assert ALT_TEST_URL in verify_text
 
-    async def test_health_check_tool(self, mcp_server):
+    async def test_health_check_tool(self, mcp_server, monkeypatch):
         """Test health check tool through MCP client interface"""
-        # Mock the health check to avoid requiring actual Meilisearch
-        with patch.object(
-            mcp_server.meili_client, "health_check", new_callable=AsyncMock
-        ) as mock_health:
-            mock_health.return_value = True
-            result = await simulate_mcp_call(mcp_server, "health-check")
+        # Swap in a fake to avoid requiring actual Meilisearch
+        health_check = _CountingFake(True)
+        monkeypatch.setattr(mcp_server.meili_client, "health_check", health_check)
+
+        result = await simulate_mcp_call(mcp_server, "health-check")
 
-            assert_text_content_response(result, "available")
-            mock_health.assert_called_once()
+        assert_text_content_response(result, "available")
+        assert health_check.calls == 1
 
     async def test_tool_error_handling(self, mcp_server):
         """Test that MCP client receives proper error responses from server"""
@@ -192,31 +314,25 @@ class TestMCPClientIntegration:
         text = assert_text_content_response(result, "Error:")
         assert "Unknown tool" in text
 
-    async def test_tool_schema_validation(self, mcp_server):
+    @pytest.mark.parametrize(
+        "tool_name, required_field, field_type",
+        [("create-index", "uid", "string"), ("search", "query", "string")],
+    )
+    async def test_tool_schema_validation(
+        self, tools_by_name, tool_name, required_field, field_type
+    ):
         """Test that tools have proper input schemas for MCP client validation"""
-        tools = await simulate_list_tools(mcp_server)
-
-        # Check specific tool schemas
-        create_index_tool = next(tool for tool in tools if tool.name == "create-index")
-        assert create_index_tool.inputSchema["type"] == "object"
-        assert "uid" in create_index_tool.inputSchema["required"]
-        assert "uid" in create_index_tool.inputSchema["properties"]
-        assert create_index_tool.inputSchema["properties"]["uid"]["type"] == "string"
-
-        search_tool = next(tool for tool in tools if tool.name == "search")
-        assert search_tool.inputSchema["type"] == "object"
-        assert "query" in search_tool.inputSchema["required"]
-        assert "query" in search_tool.inputSchema["properties"]
-        assert search_tool.inputSchema["properties"]["query"]["type"] == "string"
+        schema = tools_by_name[tool_name].inputSchema
+        assert schema["type"] == "object"
+        assert required_field in schema["required"]
+        assert schema["properties"][required_field]["type"] == field_type
 
     async def test_mcp_server_initialization(self, mcp_server):
         """Test that MCP server initializes correctly for client connections"""
         # Verify server has required attributes
-        assert hasattr(mcp_server, "server")
-        assert hasattr(mcp_server, "meili_client")
-        assert hasattr(mcp_server, "url")
-        assert hasattr(mcp_server, "api_key")
-        assert hasattr(mcp_server, "logger")
+        required = {"server", "meili_client", "url", "api_key", "logger"}
+        missing = required - vars(mcp_server).keys()
+        assert not missing, missing
 
         # Verify server name and basic configuration
         assert mcp_server.server.name == "meilisearch"
@@ -227,80 +343,22 @@ class TestMCPClientIntegration:
 class TestMCPToolDiscovery:
     """Detailed tests for MCP tool discovery functionality"""
 
-    async def test_complete_tool_list(self, mcp_server):
+    async def test_complete_tool_list(self, tools_list):
         """Test that all expected tools are discoverable by MCP clients"""
-        tools = await simulate_list_tools(mcp_server)
+        tools = tools_list
         tool_names = [tool.name for tool in tools]
 
-        # Complete list of expected tools (26 total - includes 4 new chat tools)
-        expected_tools = [
-            "get-connection-settings",
-            "update-connection-settings",
-            "health-check",
-            "get-version",
-            "get-stats",
-            "create-index",
-            "list-indexes",
-            "delete-index",
-            "get-documents",
-            "add-documents",
-            "get-settings",
-            "update-settings",
-            "search",
-            "get-task",
-            "get-tasks",
-            "cancel-tasks",
-            "get-keys",
-            "create-key",
-            "delete-key",
-            "get-health-status",
-            "get-index-metrics",
-            "get-system-info",
-            # New chat tools added in v0.6.0
-            "create-chat-completion",
-            "get-chat-workspaces",
-            "get-chat-workspace-settings",
-            "update-chat-workspace-settings",
-        ]
-
-        assert len(tools) == len(expected_tools)
-        for tool_name in expected_tools:
-            assert tool_name in tool_names
+        assert len(tools) == len(EXPECTED_TOOLS)
+        assert EXPECTED_TOOLS <= set(tool_names), sorted(
+            EXPECTED_TOOLS - set(tool_names)
+        )
 
-    async def test_tool_categorization(self, mcp_server):
+    async def test_tool_categorization(self, tools_list):
         """Test that tools can be categorized for MCP client organization"""
-        tools = await simulate_list_tools(mcp_server)
+        tools = tools_list
 
         # Categorize tools by functionality
-        categories = {
-            "connection": [t for t in tools if "connection" in t.name],
-            "index": [
-                t
-                for t in tools
-                if any(
-                    word in t.name
-                    for word in [
-                        "index",
-                        "create-index",
-                        "list-indexes",
-                        "delete-index",
-                    ]
-                )
-            ],
-            "document": [t for t in tools if "document" in t.name],
-            "search": [t for t in tools if "search" in t.name],
-            "task": [t for t in tools if "task" in t.name],
-            "key": [t for t in tools if "key" in t.name],
-            "monitoring": [
-                t
-                for t in tools
-                if any(
-                    word in t.name
-                    for word in ["health", "stats", "version", "system", "metrics"]
-                )
-            ],
-            "chat": [t for t in tools if "chat" in t.name],
-        }
+        categories = _categorize(tuple(tool.name for tool in tools))
 
         # Verify minimum expected tools per category
         expected_counts = {
@@ -316,7 +374,7 @@ class TestMCPToolDiscovery:
 
         for category, min_count in expected_counts.items():
             assert (
-                len(categories[category]) >= min_count
+                len(categories.get(category, ())) >= min_count
             ), f"Category '{category}' has insufficient tools"
 
 
@@ -340,10 +398,34 @@ class TestMCPConnectionSettings:
         expected_key_display = "********" if mcp_server.api_key else "Not set"
         assert expected_key_display in text or "Not set" in text
 
+    async def test_connection_update_reuses_pooled_session(
+        self, mcp_server, recording_session, monkeypatch
+    ):
+        """Test that the rebuilt client and its indexes send through the
+        server's HTTP session"""
+        monkeypatch.setattr(mcp_server, "session", recording_session)
+
+        await simulate_mcp_call(
+            mcp_server,
+            "update-connection-settings",
+            {"url": ALT_TEST_URL, "api_key": TEST_API_KEY},
+        )
+
+        client = mcp_server.meili_client.client
+        for call in (client.get_version, lambda: client.index("pooled").get_stats()):
+            with pytest.raises(MeilisearchCommunicationError):
+                call()
+
+        assert [url for _, url, _ in recording_session.calls] == [
+            f"{ALT_TEST_URL}/version",
+            f"{ALT_TEST_URL}/indexes/pooled/stats",
+        ]
+
 
 class TestIssue16GetDocumentsJsonSerialization:
     """Test for issue #16 - get-documents should return JSON, not Python object representations"""
 
+    @pytest.mark.usefixtures("requires_meilisearch")
     async def test_get_documents_returns_json_not_python_object(self, mcp_server):
         """Test that get-documents returns JSON-formatted text, not Python object string representation (issue #16)"""
         test_index = generate_unique_index_name("test_issue16")
@@ -361,51 +443,45 @@ class TestIssue16GetDocumentsJsonSerialization:
 
         response_text = assert_text_content_response(result, "Documents:")
 
+        matches = {m.lastgroup for m in ISSUE16_PATTERN.finditer(response_text)}
+
         # Issue #16 assertion: Should NOT contain Python object representation
-        assert (
-            "<meilisearch.models.document.DocumentsResults object at"
-            not in response_text
-        )
-        assert "DocumentsResults" not in response_text
+        assert "object_repr" not in matches
+        assert "results_repr" not in matches
 
         # Should contain actual document content
-        assert "Test Document" in response_text
-        assert "Test content" in response_text
+        assert {"title", "content"} <= matches, response_text
 
         # Should be valid JSON after the "Documents:" prefix
         json_part = response_text.replace("Documents:", "").strip()
         try:
-            parsed_data = json.loads(json_part)
+            parsed_data = orjson.loads(json_part)
             assert isinstance(parsed_data, dict)
             assert "results" in parsed_data
             assert len(parsed_data["results"]) > 0
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pytest.fail(f"get-documents returned non-JSON data: {response_text}")
 
-    async def test_update_connection_settings_persistence(self, mcp_server):
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"url": ALT_TEST_URL},
+            {"api_key": TEST_API_KEY},
+            {"url": ALT_TEST_URL_2, "api_key": FINAL_TEST_KEY},
+        ],
+        ids=["url", "api_key", "url_and_api_key"],
+    )
+    async def test_update_connection_settings_persistence(self, mcp_server, payload):
         """Test that connection updates persist for MCP client sessions"""
-        # Test URL update
-        await simulate_mcp_call(
-            mcp_server, "update-connection-settings", {"url": ALT_TEST_URL}
-        )
-        assert mcp_server.url == ALT_TEST_URL
-        assert mcp_server.meili_client.client.config.url == ALT_TEST_URL
+        expected_url = payload.get("url", mcp_server.url)
+        expected_key = payload.get("api_key", mcp_server.api_key)
 
-        # Test API key update
-        await simulate_mcp_call(
-            mcp_server, "update-connection-settings", {"api_key": TEST_API_KEY}
-        )
-        assert mcp_server.api_key == TEST_API_KEY
-        assert mcp_server.meili_client.client.config.api_key == TEST_API_KEY
+        await simulate_mcp_call(mcp_server, "update-connection-settings", payload)
 
-        # Test both updates together
-        await simulate_mcp_call(
-            mcp_server,
-            "update-connection-settings",
-            {"url": ALT_TEST_URL_2, "api_key": FINAL_TEST_KEY},
-        )
-        assert mcp_server.url == ALT_TEST_URL_2
-        assert mcp_server.api_key == FINAL_TEST_KEY
+        assert mcp_server.url == expected_url
+        assert mcp_server.api_key == expected_key
+        assert mcp_server.meili_client.client.config.url == expected_url
+        assert mcp_server.meili_client.client.config.api_key == expected_key
 
     async def test_connection_settings_validation(self, mcp_server):
         """Test that MCP client receives validation for connection settings"""
@@ -426,60 +502,42 @@ class TestIssue16GetDocumentsJsonSerialization:
 class TestIssue17DefaultLimitOffset:
     """Test for issue #17 - get-documents should use default limit and offset to avoid None parameter errors"""
 
-    async def test_get_documents_without_limit_offset_parameters(self, mcp_server):
+    async def test_get_documents_without_limit_offset_parameters(
+        self, mcp_server, populated_index
+    ):
         """Test that get-documents works without providing limit/offset parameters (issue #17)"""
-        test_index = generate_unique_index_name("test_issue17")
-        test_documents = [
-            {"id": 1, "title": "Test Document 1", "content": "Content 1"},
-            {"id": 2, "title": "Test Document 2", "content": "Content 2"},
-            {"id": 3, "title": "Test Document 3", "content": "Content 3"},
-        ]
-
-        # Create index and add test documents
-        await create_test_index_with_documents(mcp_server, test_index, test_documents)
-
         # Test get-documents without any limit/offset parameters (should use defaults)
         result = await simulate_mcp_call(
-            mcp_server, "get-documents", {"indexUid": test_index}
+            mcp_server, "get-documents", {"indexUid": populated_index}
         )
         assert_text_content_response(result, "Documents:")
         # Should not get any errors about None parameters
 
-    async def test_get_documents_with_explicit_parameters(self, mcp_server):
+    async def test_get_documents_with_explicit_parameters(
+        self, mcp_server, populated_index
+    ):
         """Test that get-documents still works with explicit limit/offset parameters"""
-        test_index = generate_unique_index_name("test_issue17_explicit")
-        test_documents = [
-            {"id": 1, "title": "Test Document 1", "content": "Content 1"},
-            {"id": 2, "title": "Test Document 2", "content": "Content 2"},
-        ]
-
-        # Create index and add test documents
-        await create_test_index_with_documents(mcp_server, test_index, test_documents)
-
-        # Test get-documents with explicit parameters
         result = await simulate_mcp_call(
             mcp_server,
             "get-documents",
-            {"indexUid": test_index, "offset": 0, "limit": 1},
+            {"indexUid": populated_index, "offset": 0, "limit": 1},
         )
         assert_text_content_response(result, "Documents:")
 
-    async def test_get_documents_default_values_applied(self, mcp_server):
+    async def test_get_documents_default_values_applied(
+        self, mcp_server, populated_index
+    ):
         """Test that default values (offset=0, limit=20) are properly applied"""
-        test_index = generate_unique_index_name("test_issue17_defaults")
-        test_documents = [{"id": i, "title": f"Document {i}"} for i in range(1, 6)]
-
-        # Create index and add test documents
-        await create_test_index_with_documents(mcp_server, test_index, test_documents)
-
         # Test that both calls with and without parameters work
-        result_no_params = await simulate_mcp_call(
-            mcp_server, "get-documents", {"indexUid": test_index}
-        )
-        result_with_defaults = await simulate_mcp_call(
+        result_no_params, result_with_defaults = await run_tool_matrix(
             mcp_server,
-            "get-documents",
-            {"indexUid": test_index, "offset": 0, "limit": 20},
+            [
+                ("get-documents", {"indexUid": populated_index}),
+                (
+                    "get-documents",
+                    {"indexUid": populated_index, "offset": 0, "limit": 20},
+                ),
+            ],
         )
 
         # Both should work and return similar results
@@ -490,21 +548,19 @@ class TestIssue17DefaultLimitOffset:
 class TestIssue23DeleteIndexTool:
     """Test for issue #23 - Add delete-index MCP tool functionality"""
 
-    async def test_delete_index_tool_discovery(self, mcp_server):
+    async def test_delete_index_tool_discovery(self, tools_by_name):
         """Test that delete-index tool is discoverable by MCP clients (issue #23)"""
-        tools = await simulate_list_tools(mcp_server)
-        tool_names = [tool.name for tool in tools]
-
-        assert "delete-index" in tool_names
+        assert "delete-index" in tools_by_name
 
         # Find the delete-index tool and verify its schema
-        delete_tool = next(tool for tool in tools if tool.name == "delete-index")
+        delete_tool = tools_by_name["delete-index"]
         assert delete_tool.description == "Delete a Meilisearch index"
         assert delete_tool.inputSchema["type"] == "object"
         assert "uid" in delete_tool.inputSchema["required"]
         assert "uid" in delete_tool.inputSchema["properties"]
         assert delete_tool.inputSchema["properties"]["uid"]["type"] == "string"
 
+    @pytest.mark.usefixtures("requires_meilisearch")
     async def test_delete_index_successful_deletion(self, mcp_server):
         """Test successful index deletion through MCP client (issue #23)"""
         test_index = generate_unique_index_name("test_delete_success")
@@ -533,6 +589,7 @@ class TestIssue23DeleteIndexTool:
         list_text_after = assert_text_content_response(list_result_after)
         assert test_index not in list_text_after
 
+    @pytest.mark.usefixtures("requires_meilisearch")
     async def test_delete_index_with_documents(self, mcp_server):
         """Test deleting index that contains documents (issue #23)"""
         test_index = generate_unique_index_name("test_delete_with_docs")
@@ -566,6 +623,7 @@ class TestIssue23DeleteIndexTool:
         list_text = assert_text_content_response(list_result)
         assert test_index not in list_text
 
+    @pytest.mark.usefixtures("requires_meilisearch")
     async def test_delete_nonexistent_index_behavior(self, mcp_server):
         """Test behavior when deleting non-existent index (issue #23)"""
         nonexistent_index = generate_unique_index_name("nonexistent")
@@ -587,6 +645,7 @@ class TestIssue23DeleteIndexTool:
         response_text = assert_text_content_response(result, "error:")
         assert "error:" in response_text
 
+    @pytest.mark.usefixtures("requires_meilisearch")
     async def test_delete_index_integration_workflow(self, mcp_server):
         """Test complete workflow: create -> add docs -> search -> delete (issue #23)"""
         test_index = generate_unique_index_name("test_delete_workflow")
@@ -622,9 +681,9 @@ class TestIssue23DeleteIndexTool:
 class TestIssue27OpenAISchemaCompatibility:
     """Test for issue #27 - Fix JSON schemas for OpenAI Agent SDK compatibility"""
 
-    async def test_all_schemas_have_additional_properties_false(self, mcp_server):
+    async def test_all_schemas_have_additional_properties_false(self, tools_list):
         """Test that all tool schemas include additionalProperties: false for OpenAI compatibility (issue #27)"""
-        tools = await simulate_list_tools(mcp_server)
+        tools = tools_list
 
         for tool in tools:
             schema = tool.inputSchema
@@ -636,9 +695,9 @@ class TestIssue27OpenAISchemaCompatibility:
                 schema["additionalProperties"] is False
             ), f"Tool '{tool.name}' additionalProperties should be false"
 
-    async def test_array_schemas_have_items_property(self, mcp_server):
+    async def test_array_schemas_have_items_property(self, tools_list):
         """Test that all array schemas include items property for OpenAI compatibility (issue #27)"""
-        tools = await simulate_list_tools(mcp_server)
+        tools = tools_list
 
         tools_with_arrays = ["add-documents", "search", "get-tasks", "create-key"]
 
@@ -656,9 +715,9 @@ class TestIssue27OpenAISchemaCompatibility:
                             prop_schema["items"], dict
                         ), f"Tool '{tool.name}' property '{prop_name}' items should be object"
 
-    async def test_no_custom_optional_properties(self, mcp_server):
+    async def test_no_custom_optional_properties(self, tools_list):
         """Test that schemas don't use non-standard 'optional' property (issue #27)"""
-        tools = await simulate_list_tools(mcp_server)
+        tools = tools_list
 
         for tool in tools:
             schema = tool.inputSchema
@@ -669,10 +728,9 @@ class TestIssue27OpenAISchemaCompatibility:
                     "optional" not in prop_schema
                 ), f"Tool '{tool.name}' property '{prop_name}' uses non-standard 'optional'"
 
-    async def test_specific_add_documents_schema_compliance(self, mcp_server):
+    async def test_specific_add_documents_schema_compliance(self, tools_by_name):
         """Test add-documents schema specifically mentioned in issue #27"""
-        tools = await simulate_list_tools(mcp_server)
-        add_docs_tool = next(tool for tool in tools if tool.name == "add-documents")
+        add_docs_tool = tools_by_name["add-documents"]
 
         schema = add_docs_tool.inputSchema
 
@@ -695,9 +753,9 @@ class TestIssue27OpenAISchemaCompatibility:
         assert "documents" in schema["required"]
         assert "primaryKey" not in schema["required"]  # Should be optional
 
-    async def test_openai_compatible_tool_schema_format(self, mcp_server):
+    async def test_openai_compatible_tool_schema_format(self, tools_list):
         """Test that tool schemas follow OpenAI function calling format (issue #27)"""
-        tools = await simulate_list_tools(mcp_server)
+        tools = tools_list
 
         for tool in tools:
             # Verify tool has required OpenAI attributes
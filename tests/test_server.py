@@ -7,3 +7,14 @@ def test_server_creation():
     server = create_server()
     assert server is not None
     assert server.meili_client is not None
+
+
+def test_cleanup_closes_session(monkeypatch):
+    """Test that shutting the server down closes its HTTP session"""
+    server = create_server()
+    closed = []
+    monkeypatch.setattr(server.session, "close", lambda: closed.append(True))
+
+    server.cleanup()
+
+    assert closed == [True]
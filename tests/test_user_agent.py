@@ -1,33 +1,47 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from meilisearch import Client
 from src.meilisearch_mcp.client import MeilisearchClient
 from src.meilisearch_mcp.__version__ import __version__
 
 
-def test_meilisearch_client_sets_custom_user_agent():
+class _RecordingClient(Client):
+    """Real Client that remembers the arguments of its latest construction"""
+
+    last_call = None
+
+    def __init__(self, *args, **kwargs):
+        type(self).last_call = (args, kwargs)
+        super().__init__(*args, **kwargs)
+
+
+@pytest.fixture
+def recording_client(monkeypatch):
+    """Route MeilisearchClient through _RecordingClient"""
+    monkeypatch.setattr("src.meilisearch_mcp.client.Client", _RecordingClient)
+    _RecordingClient.last_call = None
+    return _RecordingClient
+
+
+def test_meilisearch_client_sets_custom_user_agent(recording_client):
     """Test that MeilisearchClient initializes with custom user agent"""
-    with patch("src.meilisearch_mcp.client.Client") as mock_client:
-        # Create a MeilisearchClient instance
-        client = MeilisearchClient(url="http://localhost:7700", api_key="test_key")
+    # Create a MeilisearchClient instance
+    client = MeilisearchClient(url="http://localhost:7700", api_key="test_key")
 
-        # Verify that Client was called with the correct parameters
-        mock_client.assert_called_once_with(
-            "http://localhost:7700",
-            "test_key",
-            client_agents=("meilisearch-mcp", f"v{__version__}"),
-        )
+    # Verify that Client was called with the correct parameters
+    assert recording_client.last_call == (
+        ("http://localhost:7700", "test_key"),
+        {"client_agents": ("meilisearch-mcp", f"v{__version__}")},
+    )
 
 
-def test_user_agent_includes_correct_version():
+def test_user_agent_includes_correct_version(recording_client):
     """Test that the user agent includes the correct version from __version__.py"""
-    with patch("src.meilisearch_mcp.client.Client") as mock_client:
-        client = MeilisearchClient()
+    client = MeilisearchClient()
 
-        # Extract the client_agents parameter from the call
-        call_args = mock_client.call_args
-        client_agents = call_args[1]["client_agents"]
+    # Extract the client_agents parameter from the call
+    client_agents = recording_client.last_call[1]["client_agents"]
 
-        # Verify format and version
-        assert client_agents[0] == "meilisearch-mcp"
-        assert client_agents[1] == "v0.5.0"
-        assert client_agents[1] == f"v{__version__}"
+    # Verify format and version
+    assert client_agents[0] == "meilisearch-mcp"
+    assert client_agents[1] == "v0.5.0"
+    assert client_agents[1] == f"v{__version__}"